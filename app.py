@@ -2,8 +2,8 @@ import math
 import os
 from io import BytesIO
 
+import numpy as np
 import streamlit as st
-from fpdf import FPDF
 
 # -------------------------------------------------
 # CONFIG
@@ -16,42 +16,79 @@ st.set_page_config(
 # -------------------------------------------------
 # HELPERS
 # -------------------------------------------------
+@st.cache_data
+def _read_asset(path: str):
+    """Return the bytes of a static asset (only called for files that exist)."""
+    with open(path, "rb") as f:
+        return f.read()
+
+
 def safe_sidebar_image(path: str, caption: str):
     """Show image in sidebar if it exists, otherwise show a small note."""
+    # checked on every rerun so a figure added later shows up without a restart
     if os.path.exists(path):
-        st.sidebar.image(path, caption=caption, use_container_width=True)
+        st.sidebar.image(BytesIO(_read_asset(path)), caption=caption, use_container_width=True)
     else:
         st.sidebar.markdown(f"*Image not found: `{path}`*")
 
 
+SIDEBAR_FIGURES = (
+    (
+        ("fig1_compression_bending.png", "Fig. 1 – Compression Bending"),
+        ("fig2_press_bending.png", "Fig. 2 – Press Bending"),
+        ("fig3_rotary_draw_bending.png", "Fig. 3 – Rotary Draw Bending"),
+    ),
+    (
+        ("fig4_reaction_tube.png", "Fig. 4 – Tube Reaction to Bending"),
+        ("fig5_wall_factor_clr.png", "Fig. 5 – Wall Factor & CLR"),
+        ("fig6_contoured_grooves.png", "Fig. 6 – Contoured Tube Grooves"),
+        ("fig7_ram_wing_dies.png", "Fig. 7 – Ram & Wing Dies"),
+    ),
+)
+
+
 MATERIALS = {
     "Copper": {"E": 110_000.0, "yield": 200.0},        # MPa, rough typical values
     "Carbon Steel": {"E": 210_000.0, "yield": 250.0},
     "Aluminium": {"E": 70_000.0, "yield": 120.0},
 }
 
+# flat per-property lookups so the calculations do a single dict access
+_E = {name: props["E"] for name, props in MATERIALS.items()}
+_SIGMA_Y = {name: props["yield"] for name, props in MATERIALS.items()}
+_DEG2RAD = math.pi / 180.0
+
+D_OF_BEND_OPTIONS = [2.0, 2.5, 3.0, 4.0, 5.0]
+
+
+@st.cache_data(max_entries=256)
+def compute_bend_parameters(od_mm, wall_mm, angle_deg, straight_mm, d_values, material_name):
+    """Compute Wall Factor, CLR, arc length, total length, stress, etc.
 
-def compute_bend_parameters(od_mm, wall_mm, angle_deg, straight_mm, d_of_bend, material_name):
-    """Compute Wall Factor, CLR, arc length, total length, stress, etc."""
-    props = MATERIALS[material_name]
-    E = props["E"]
-    sigma_y = props["yield"]
+    Every "D" of bend in ``d_values`` is evaluated at once; each returned
+    entry is an array with one value per D (see ``bend_result_at``).
+    """
+    E = _E[material_name]
+    sigma_y = _SIGMA_Y[material_name]
 
+    d_arr = np.asarray(d_values, dtype=float)
     wall_eff = max(wall_mm, 1e-6)
-    clr = d_of_bend * od_mm                   # CLR = D * OD
-    wf = od_mm / wall_eff                     # Wall Factor
-    mbr = wf * od_mm                          # a common 'minimum bend radius' heuristic
+    clr = d_arr * od_mm                                  # CLR = D * OD
+    wf = np.full_like(d_arr, od_mm / wall_eff)           # Wall Factor
+    mbr = wf * od_mm                                     # a common 'minimum bend radius' heuristic
 
-    theta_rad = math.radians(angle_deg)
-    arc_len = clr * theta_rad                 # bend arc length along neutral axis
+    theta_rad = angle_deg * _DEG2RAD
+    arc_len = clr * theta_rad                            # bend arc length along neutral axis
     total_len = straight_mm + arc_len
 
     # very simplified outer-fibre bending stress: sigma = E * (epsilon),
     # epsilon ~ (t/2) / CLR  (outer fibre strain)
-    stress = E * ((wall_mm / 2.0) / max(clr, 1e-6)) / 1000.0  # convert to MPa-ish scale
-    fos = sigma_y / stress if stress > 0 else float("inf")
+    stress = E * ((wall_mm / 2.0) / np.maximum(clr, 1e-6)) / 1000.0  # convert to MPa-ish scale
+    with np.errstate(divide="ignore"):
+        fos = sigma_y / stress                           # zero stress -> inf, as before
 
     return {
+        "d_of_bend": d_arr,
         "wf": wf,
         "clr": clr,
         "mbr": mbr,
@@ -62,8 +99,24 @@ def compute_bend_parameters(od_mm, wall_mm, angle_deg, straight_mm, d_of_bend, m
     }
 
 
+def bend_result_at(table, index):
+    """Pick one "D" of bend out of a compute_bend_parameters table as plain floats."""
+    return {
+        "wf": float(table["wf"][index]),
+        "clr": float(table["clr"][index]),
+        "mbr": float(table["mbr"][index]),
+        "arc_len": float(table["arc_len"][index]),
+        "total_len": float(table["total_len"][index]),
+        "stress": float(table["stress"][index]),
+        "fos": float(table["fos"][index]),
+    }
+
+
+@st.cache_data(max_entries=64)
 def generate_pdf_report(inputs, results):
     """Return a PDF report as bytes."""
+    from fpdf import FPDF  # imported lazily to keep app start-up fast
+
     pdf = FPDF()
     pdf.set_auto_page_break(auto=True, margin=15)
     pdf.add_page()
@@ -73,24 +126,28 @@ def generate_pdf_report(inputs, results):
     pdf.ln(5)
 
     pdf.set_font("Arial", "", 12)
-    pdf.cell(0, 8, f"Material          : {inputs['material']}", ln=True)
-    pdf.cell(0, 8, f"Tube O.D.         : {inputs['od']:.2f} mm", ln=True)
-    pdf.cell(0, 8, f"Wall Thickness    : {inputs['wall']:.2f} mm", ln=True)
-    pdf.cell(0, 8, f"Bend Angle        : {inputs['angle']:.2f} °", ln=True)
-    pdf.cell(0, 8, f"Straight Length   : {inputs['straight']:.2f} mm", ln=True)
-    pdf.cell(0, 8, f'"D" of Bend (CLR/OD): {inputs["d_of_bend"]:.2f}', ln=True)
+    pdf.multi_cell(0, 8, "\n".join([
+        f"Material          : {inputs['material']}",
+        f"Tube O.D.         : {inputs['od']:.2f} mm",
+        f"Wall Thickness    : {inputs['wall']:.2f} mm",
+        f"Bend Angle        : {inputs['angle']:.2f} °",
+        f"Straight Length   : {inputs['straight']:.2f} mm",
+        f'"D" of Bend (CLR/OD): {inputs["d_of_bend"]:.2f}',
+    ]))
     pdf.ln(4)
 
     pdf.set_font("Arial", "B", 13)
     pdf.cell(0, 8, "Calculated Values", ln=True)
     pdf.set_font("Arial", "", 12)
-    pdf.cell(0, 8, f"Wall Factor (WF = OD / t)         : {results['wf']:.2f}", ln=True)
-    pdf.cell(0, 8, f"Center-Line Radius (CLR)          : {results['clr']:.2f} mm", ln=True)
-    pdf.cell(0, 8, f"Minimum Bend Radius (WF × OD)     : {results['mbr']:.2f} mm", ln=True)
-    pdf.cell(0, 8, f"Bend Arc Length                   : {results['arc_len']:.2f} mm", ln=True)
-    pdf.cell(0, 8, f"Approx. Total Tube Length         : {results['total_len']:.2f} mm", ln=True)
-    pdf.cell(0, 8, f"Simplified Outer-Fibre Stress     : {results['stress']:.2f} MPa", ln=True)
-    pdf.cell(0, 8, f"Factor of Safety vs Yield (FoS)   : {results['fos']:.2f}", ln=True)
+    pdf.multi_cell(0, 8, "\n".join([
+        f"Wall Factor (WF = OD / t)         : {results['wf']:.2f}",
+        f"Center-Line Radius (CLR)          : {results['clr']:.2f} mm",
+        f"Minimum Bend Radius (WF × OD)     : {results['mbr']:.2f} mm",
+        f"Bend Arc Length                   : {results['arc_len']:.2f} mm",
+        f"Approx. Total Tube Length         : {results['total_len']:.2f} mm",
+        f"Simplified Outer-Fibre Stress     : {results['stress']:.2f} MPa",
+        f"Factor of Safety vs Yield (FoS)   : {results['fos']:.2f}",
+    ]))
     pdf.ln(5)
 
     pdf.set_font("Arial", "B", 13)
@@ -118,14 +175,11 @@ def generate_pdf_report(inputs, results):
 # -------------------------------------------------
 st.sidebar.title("Tube Bending Reference")
 
-safe_sidebar_image("fig1_compression_bending.png", "Fig. 1 – Compression Bending")
-safe_sidebar_image("fig2_press_bending.png", "Fig. 2 – Press Bending")
-safe_sidebar_image("fig3_rotary_draw_bending.png", "Fig. 3 – Rotary Draw Bending")
-st.sidebar.markdown("---")
-safe_sidebar_image("fig4_reaction_tube.png", "Fig. 4 – Tube Reaction to Bending")
-safe_sidebar_image("fig5_wall_factor_clr.png", "Fig. 5 – Wall Factor & CLR")
-safe_sidebar_image("fig6_contoured_grooves.png", "Fig. 6 – Contoured Tube Grooves")
-safe_sidebar_image("fig7_ram_wing_dies.png", "Fig. 7 – Ram & Wing Dies")
+for i, group in enumerate(SIDEBAR_FIGURES):
+    if i:
+        st.sidebar.markdown("---")
+    for path, caption in group:
+        safe_sidebar_image(path, caption)
 
 st.sidebar.markdown(
     """
@@ -177,7 +231,7 @@ From **Figure 5**:
 
 d_of_bend = st.selectbox(
     '"D" of Bend (CLR / O.D.)',
-    [2.0, 2.5, 3.0, 4.0, 5.0],
+    D_OF_BEND_OPTIONS,
     index=2,
     help="Tighter bends → lower D (e.g. 2×D); gentler bends → higher D (e.g. 4–5×D).",
 )
@@ -185,7 +239,8 @@ d_of_bend = st.selectbox(
 # ---------------- CALCULATIONS ----------------
 st.header("2️⃣ Calculated Values")
 
-results = compute_bend_parameters(od, wall, angle, straight_len, d_of_bend, material)
+bend_table = compute_bend_parameters(od, wall, angle, straight_len, D_OF_BEND_OPTIONS, material)
+results = bend_result_at(bend_table, D_OF_BEND_OPTIONS.index(d_of_bend))
 
 colA, colB, colC = st.columns(3)
 with colA:
@@ -204,6 +259,20 @@ with colE:
 st.metric("Simplified Outer-Fibre Stress (MPa)", f"{results['stress']:.2f}")
 st.metric("Factor of Safety vs Yield", f"{results['fos']:.2f}")
 
+with st.expander("Compare all “D” of Bend options"):
+    st.dataframe(
+        {
+            '"D" of Bend': bend_table["d_of_bend"],
+            "CLR (mm)": bend_table["clr"],
+            "Arc Length (mm)": bend_table["arc_len"],
+            "Total Length (mm)": bend_table["total_len"],
+            "Stress (MPa)": bend_table["stress"],
+            "FoS": bend_table["fos"],
+        },
+        hide_index=True,
+        use_container_width=True,
+    )
+
 # ---------------- FORMULA REFERENCE ----------------
 st.header("3️⃣ Formula & Concept Reference")
 
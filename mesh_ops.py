@@ -1,12 +1,63 @@
-import trimesh
+import hashlib
+import os
+import threading
+from io import BytesIO
+
 import numpy as np
 
+_N_CENTER_POINTS = 50
+_BBOX_CACHE = {}  # blake2b digest of the STL bytes -> (extents, transform)
+_BBOX_CACHE_SIZE = 32
+_BBOX_CACHE_LOCK = threading.Lock()  # Streamlit sessions run in separate threads
+
+
+def _load_bbox(file):
+    """Return (extents, transform) of the mesh's oriented bounding box.
+
+    The mesh is only parsed the first time a given file content is seen.
+    """
+    if hasattr(file, "read"):
+        if hasattr(file, "seek"):
+            file.seek(0)  # the upload may already have been read on an earlier run
+        data = file.read()
+        name = getattr(file, "name", "") or ""
+    else:
+        with open(file, "rb") as f:
+            data = f.read()
+        name = str(file)
+    file_type = os.path.splitext(name)[1].lstrip(".").lower() or "stl"
+
+    key = hashlib.blake2b(data).digest()
+    cached = _BBOX_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    import trimesh  # heavy (pulls in scipy etc.), only needed on a cache miss
+
+    mesh = trimesh.load(BytesIO(data), file_type=file_type, force='mesh')
+    box = mesh.bounding_box_oriented.primitive
+    extents = np.array(box.extents, dtype=float)
+    transform = np.array(box.transform, dtype=float)
+    # the same arrays are handed to every caller, so make them read-only
+    extents.flags.writeable = False
+    transform.flags.writeable = False
+    cached = (extents, transform)
+
+    with _BBOX_CACHE_LOCK:
+        while len(_BBOX_CACHE) >= _BBOX_CACHE_SIZE:
+            _BBOX_CACHE.pop(next(iter(_BBOX_CACHE)))
+        _BBOX_CACHE[key] = cached
+    return cached
+
+
 def load_stl_and_extract_centerline(file):
-    mesh = trimesh.load(file, force='mesh')
+    extents, transform = _load_bbox(file)
 
-    # bounding box centerline
-    bbox = mesh.bounding_box_oriented
-    center_points = bbox.sample_volume(50)
+    # bounding box centerline: evenly spaced points along the longest box axis
+    axis = int(np.argmax(extents))
+    local = np.zeros((_N_CENTER_POINTS, 3))
+    local[:, axis] = np.linspace(-extents[axis] / 2.0, extents[axis] / 2.0, _N_CENTER_POINTS)
+    center_points = local @ transform[:3, :3].T + transform[:3, 3]
 
     # fake bend detection (you can improve later)
     bends = center_points[::10]
@@ -1,14 +1,13 @@
 # pdf_reader.py
-import PyPDF2
 
 def extract_text(pdf_path):
-    text = ""
+    import pypdf
+
     with open(pdf_path, "rb") as f:
-        reader = PyPDF2.PdfReader(f)
-        for page in reader.pages:
-            text += page.extract_text()
-    return text
+        reader = pypdf.PdfReader(f)
+        return "".join(page.extract_text() or "" for page in reader.pages)
 
-# Example
-text = extract_text("pdfs/Bend_manual.pdf")
-print(text[:500])  # print first 500 characters
+if __name__ == "__main__":
+    # Example
+    text = extract_text("pdfs/Bend_manual.pdf")
+    print(text[:500])  # print first 500 characters